@@ -25,32 +25,72 @@ class PacketMonitor(Protocol):
 class PacketCollector:
     def __init__(self):
         self.monitors: list[Callable] = []
+        # Immutable snapshots of the bound monitor callbacks.  Monitors
+        # register themselves at import time, before the config file
+        # has been parsed, so instantiating them has to wait until the
+        # first packet; _bind() builds these tuples then.  The
+        # per-packet loops iterate the tuples so registration churn can
+        # never invalidate an iteration.
+        self._rx_callbacks: tuple[Callable, ...] = ()
+        self._tx_callbacks: tuple[Callable, ...] = ()
+        self._bound = False
 
     def register(self, monitor: Callable) -> None:
+        # Cheap structural check on the class; the full Protocol
+        # isinstance runs once against the instance in _bind().
+        if not (
+            callable(getattr(monitor, "rx", None))
+            and callable(getattr(monitor, "tx", None))
+        ):
+            raise TypeError(f"Monitor {monitor} is not a PacketMonitor")
         self.monitors.append(monitor)
+        self._unbind()
 
     def unregister(self, monitor: Callable) -> None:
         self.monitors.remove(monitor)
+        self._unbind()
 
-    def rx(self, packet: type[core.Packet]) -> None:
-        for name in self.monitors:
-            cls = name()
-            if isinstance(cls, PacketMonitor):
-                try:
-                    cls.rx(packet)
-                except Exception as e:
-                    LOG.error(f"Error in monitor {name} (rx): {e}")
+    def _unbind(self) -> None:
+        self._rx_callbacks = ()
+        self._tx_callbacks = ()
+        self._bound = False
+
+    def _bind(self) -> None:
+        """Instantiate the monitors once and cache their callbacks.
 
-            else:
-                raise TypeError(f"Monitor {name} is not a PacketMonitor")
+        This runs on the first packet after a registration change,
+        which is after the config has been loaded, so the monitor
+        singletons see the user's settings.  isinstance against a
+        runtime_checkable Protocol walks attributes and is far too
+        slow to run for every packet; doing it here keeps it off the
+        rx/tx path.
+        """
+        instances = [monitor() for monitor in self.monitors]
+        for instance in instances:
+            if not isinstance(instance, PacketMonitor):
+                raise TypeError(f"Monitor {instance} is not a PacketMonitor")
+        self._rx_callbacks = tuple(i.rx for i in instances)
+        self._tx_callbacks = tuple(i.tx for i in instances)
+        self._bound = True
+
+    def rx(self, packet: type[core.Packet]) -> None:
+        if not self._bound:
+            self._bind()
+        if not self._rx_callbacks:
+            return
+        for callback in self._rx_callbacks:
+            try:
+                callback(packet)
+            except Exception as e:
+                LOG.error(f"Error in monitor {callback} (rx): {e}")
 
     def tx(self, packet: type[core.Packet]) -> None:
-        for name in self.monitors:
-            cls = name()
-            if isinstance(cls, PacketMonitor):
-                try:
-                    cls.tx(packet)
-                except Exception as e:
-                    LOG.error(f"Error in monitor {name} (tx): {e}")
-            else:
-                raise TypeError(f"Monitor {name} is not a PacketMonitor")
+        if not self._bound:
+            self._bind()
+        if not self._tx_callbacks:
+            return
+        for callback in self._tx_callbacks:
+            try:
+                callback(packet)
+            except Exception as e:
+                LOG.error(f"Error in monitor {callback} (tx): {e}")
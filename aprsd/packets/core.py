@@ -109,6 +109,15 @@ class Packet:
     path: List[str] = field(default_factory=list, compare=False, hash=False)
     via: Optional[str] = field(default=None, compare=False, hash=False)
 
+    # Memoized class name.  The stats accounting needs this for every
+    # single packet, so keep it as a class attribute instead of
+    # recomputing __class__.__name__ on the hot path.
+    _ptype = "Packet"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ptype = cls.__name__
+
     def get(self, key: str, default: Optional[str] = None):
         """Emulate a getter on a dict."""
         if hasattr(self, key):
@@ -692,6 +701,8 @@ class UnknownPacket:
 
     All of the unknown attributes are stored in the unknown_fields
     """
+    _ptype = "UnknownPacket"
+
     unknown_fields: CatchAll
     _type: str = "UnknownPacket"
     from_call: Optional[str] = field(default=None)
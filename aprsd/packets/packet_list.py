@@ -1,5 +1,6 @@
-from collections import OrderedDict
+import itertools
 import logging
+import threading
 
 from oslo_config import cfg
 
@@ -11,6 +12,21 @@ CONF = cfg.CONF
 LOG = logging.getLogger("APRSD")
 
 
+def _known_types() -> dict:
+    """Build the types accounting seeded with every Packet class we know.
+
+    The values are [rx_count, tx_count] pairs, so the rx/tx path can
+    increment by index without checking for a missing key first.
+    """
+    types = {core.UnknownPacket._ptype: [0, 0]}
+    stack = [core.Packet]
+    while stack:
+        klass = stack.pop()
+        types[klass._ptype] = [0, 0]
+        stack.extend(klass.__subclasses__())
+    return types
+
+
 class PacketList(objectstore.ObjectStoreMixin):
     """Class to keep track of the packets we tx/rx."""
     _instance = None
@@ -21,93 +37,185 @@ class PacketList(objectstore.ObjectStoreMixin):
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # Nothing in this class re-acquires the lock while holding
+            # it, so a plain Lock is enough and is cheaper to take than
+            # the mixin's default RLock.  The ring/index and the types
+            # accounting get their own locks so the rx and tx threads
+            # don't serialize on state they aren't both touching.
+            cls._instance.lock = threading.Lock()
+            cls._instance._types_lock = threading.Lock()
             cls._instance.maxlen = CONF.packet_list_maxlen
+            # itertools.count increments at the C level, so next()
+            # never loses a count even though several threads call
+            # rx()/tx() (the RX thread, the packet-processing thread
+            # and tx.send).  Concurrent assignments to _total_rx/_tx
+            # can transiently publish a slightly stale total, which is
+            # fine for stats, but don't treat these as exact under
+            # concurrency.
+            cls._instance._rx_counter = itertools.count(1)
+            cls._instance._tx_counter = itertools.count(1)
             cls._instance._init_data()
         return cls._instance
 
     def _init_data(self):
+        # Fixed size ring of the most recent packets.  This is NOT a
+        # lock-free structure: several threads feed rx()/tx() (the RX
+        # thread, the packet-processing thread and tx.send), so the
+        # ring, head counter and index are only ever mutated in _add()
+        # with self.lock held, and readers (stats/find) take the same
+        # lock for a consistent view.
+        self._ring = [None] * self.maxlen
+        self._head = 0
+        self._index = {}
+        # Direct attribute for the hot path; self.data just aliases it
+        # so the ObjectStoreMixin save/load keeps persisting it.
+        self._types = _known_types()
         self.data = {
-            "types": {},
-            "packets": OrderedDict(),
+            "types": self._types,
         }
 
     def rx(self, packet: type[core.Packet]):
         """Add a packet that was received."""
+        self._total_rx = next(self._rx_counter)
         with self.lock:
-            self._total_rx += 1
             self._add(packet)
-            ptype = packet.__class__.__name__
-            if ptype not in self.data["types"]:
-                self.data["types"][ptype] = {"tx": 0, "rx": 0}
-            self.data["types"][ptype]["rx"] += 1
+        with self._types_lock:
+            self._types.setdefault(packet._ptype, [0, 0])[0] += 1
 
     def tx(self, packet: type[core.Packet]):
         """Add a packet that was received."""
+        self._total_tx = next(self._tx_counter)
         with self.lock:
-            self._total_tx += 1
             self._add(packet)
-            ptype = packet.__class__.__name__
-            if ptype not in self.data["types"]:
-                self.data["types"][ptype] = {"tx": 0, "rx": 0}
-            self.data["types"][ptype]["tx"] += 1
+        with self._types_lock:
+            self._types.setdefault(packet._ptype, [0, 0])[1] += 1
 
     def add(self, packet):
         with self.lock:
             self._add(packet)
 
     def _add(self, packet):
-        if not self.data.get("packets"):
-            self._init_data()
-        if packet.key in self.data["packets"]:
-            self.data["packets"].move_to_end(packet.key)
-        elif len(self.data["packets"]) == self.maxlen:
-            self.data["packets"].popitem(last=False)
-        self.data["packets"][packet.key] = packet
+        # Hot path; keep everything in locals so each step is a single
+        # bytecode op instead of repeated self attribute lookups.
+        ring = self._ring
+        index = self._index
+        key = packet.key
+        slot = self._head % self.maxlen
+        evicted = ring[slot]
+        ring[slot] = packet
+        self._head += 1
+        if evicted is not None:
+            evicted_key = evicted.key
+            entry = index.get(evicted_key)
+            # Only drop the index entry if it still points at the slot
+            # being overwritten; a key that was re-added since lives in
+            # a newer slot and must stay findable.
+            if entry is not None and entry[0] == slot:
+                del index[evicted_key]
+        index[key] = (slot, packet)
 
     def find(self, packet):
         with self.lock:
-            return self.data["packets"][packet.key]
+            return self._index[packet.key][1]
 
     def __len__(self):
         with self.lock:
-            return len(self.data["packets"])
+            return len(self._index)
 
-    def total_rx(self):
+    def save(self):
+        # Put the ring contents back under self.data while the mixin
+        # pickles it, oldest first, so packets keep being persisted
+        # across restarts; load() replays them into the ring.
         with self.lock:
-            return self._total_rx
+            pkts = {}
+            oldest = max(self._head - self.maxlen, 0)
+            for i in range(oldest, self._head):
+                packet = self._ring[i % self.maxlen]
+                if packet is not None:
+                    pkts[packet.key] = packet
+        self.data["packets"] = pkts
+        # super().save() only holds self.lock while pickling, but the
+        # rx/tx path mutates the types table under _types_lock, so dump
+        # a snapshot instead of the live dict.
+        with self._types_lock:
+            self.data["types"] = {
+                ptype: list(cnt) for ptype, cnt in self._types.items()
+            }
+        try:
+            super().save()
+        finally:
+            self.data.pop("packets", None)
+            self.data["types"] = self._types
+
+    def load(self):
+        super().load()
+        # Saves from before the ring buffer kept the packets inside
+        # self.data; replay them into the ring so nothing is lost.
+        pkts = self.data.pop("packets", None)
+        if pkts:
+            with self.lock:
+                for packet in pkts.values():
+                    self._add(packet)
+        # Older saves used {"tx": n, "rx": n} dicts per type and only
+        # carried the types that had been seen.
+        types = self.data.setdefault("types", {})
+        for ptype, cnt in list(types.items()):
+            if isinstance(cnt, dict):
+                types[ptype] = [cnt.get("rx", 0), cnt.get("tx", 0)]
+        for ptype, cnt in _known_types().items():
+            types.setdefault(ptype, cnt)
+        # Re-point the hot path attribute at the loaded table.
+        self._types = types
+
+    def total_rx(self):
+        # int reads are atomic under the GIL, no lock needed.
+        return self._total_rx
 
     def total_tx(self):
-        with self.lock:
-            return self._total_tx
+        # int reads are atomic under the GIL, no lock needed.
+        return self._total_tx
 
     def stats(self, serializable=False) -> dict:
-        # limit the number of packets to return to 50
+        # Snapshot the counters without the lock; only the dict
+        # walks below need to be serialized against the rx/tx path.
+        total_rx = self._total_rx
+        total_tx = self._total_tx
+        # Only hold the lock long enough for shallow copies; building
+        # the packet list happens outside it so a slow stats consumer
+        # can't stall the rx/tx path.
         with self.lock:
-            tmp = OrderedDict(
-                reversed(
-                    list(
-                        self.data.get("packets", OrderedDict()).items(),
-                    ),
-                ),
-            )
-            pkts = []
-            count = 1
-            for packet in tmp:
-                pkts.append(tmp[packet])
-                count += 1
-                if count > CONF.packet_list_stats_maxlen:
-                    break
-
-            stats = {
-                "total_tracked": self._total_rx + self._total_rx,
-                "rx": self._total_rx,
-                "tx": self._total_tx,
-                "types": self.data.get("types", []),
-                "packet_count": len(self.data.get("packets", [])),
-                "maxlen": self.maxlen,
-                "packets": pkts,
+            head = self._head
+            ring = self._ring[:]
+            packet_count = len(self._index)
+        with self._types_lock:
+            # The web UI (echarts.js) indexes types[k]["rx"]/["tx"], so
+            # expand the internal [rx, tx] pairs into dicts here.
+            types = {
+                ptype: {"rx": cnt[0], "tx": cnt[1]}
+                for ptype, cnt in self._types.items()
             }
-            return stats
+
+        # Walk the ring backwards from the head so the newest packets
+        # come first, limited to the configured stats length.
+        pkts = []
+        oldest = max(head - self.maxlen, 0)
+        for i in range(head - 1, oldest - 1, -1):
+            packet = ring[i % self.maxlen]
+            if packet is None:
+                break
+            pkts.append(packet)
+            if len(pkts) >= CONF.packet_list_stats_maxlen:
+                break
+
+        return {
+            "total_tracked": total_rx + total_tx,
+            "rx": total_rx,
+            "tx": total_tx,
+            "types": types,
+            "packet_count": packet_count,
+            "maxlen": self.maxlen,
+            "packets": pkts,
+        }
 
 
 # Now register the PacketList with the collector
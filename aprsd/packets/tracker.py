@@ -1,5 +1,6 @@
 import datetime
 import logging
+import threading
 
 from oslo_config import cfg
 
@@ -33,56 +34,71 @@ class PacketTrack(objectstore.ObjectStoreMixin):
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # tx/_remove never nest lock acquisitions, so a plain Lock
+            # is enough and is cheaper to take than the mixin's RLock.
+            cls._instance.lock = threading.Lock()
             cls._instance._start_time = datetime.datetime.now()
             cls._instance._init_store()
         return cls._instance
 
+    # The single dict operations below are already atomic under the
+    # GIL, so the readers don't need the lock; only tx/_remove mutate
+    # the dict.  The iterating readers hand out list() snapshots so the
+    # caller can't trip over a concurrent insert/remove.
     def __getitem__(self, name):
-        with self.lock:
-            return self.data[name]
+        return self.data[name]
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key):
+        return self.data.get(key)
 
     def __iter__(self):
-        with self.lock:
-            return iter(self.data)
+        return iter(list(self.data))
 
     def keys(self):
-        with self.lock:
-            return self.data.keys()
+        return list(self.data)
 
     def items(self):
-        with self.lock:
-            return self.data.items()
+        return list(self.data.items())
 
     def values(self):
-        with self.lock:
-            return self.data.values()
+        return list(self.data.values())
 
     def stats(self, serializable=False):
-        with self.lock:
-            stats = {
-                "total_tracked": self.total_tracked,
+        # total_tracked is accumulated on tx, so there's nothing to
+        # count here.  The per-packet fields change as retries happen,
+        # so they have to be read live; walk a snapshot of the tracked
+        # packets instead of holding the lock for the whole walk and
+        # doing four lookups per key.
+        pkts = {}
+        for key, packet in list(self.data.items()):
+            pkts[key] = {
+                "last_send_time": packet.last_send_time,
+                "send_count": packet.send_count,
+                "retry_count": packet.retry_count,
+                "message": packet.raw,
             }
-            pkts = {}
-            for key in self.data:
-                last_send_time = self.data[key].last_send_time
-                pkts[key] = {
-                    "last_send_time": last_send_time,
-                    "send_count": self.data[key].send_count,
-                    "retry_count": self.data[key].retry_count,
-                    "message": self.data[key].raw,
-                }
-            stats["packets"] = pkts
-        return stats
+        return {
+            "total_tracked": self.total_tracked,
+            "packets": pkts,
+        }
 
     def rx(self, packet: type[core.Packet]) -> None:
         """When we get a packet from the network, check if we should remove it."""
-        if isinstance(packet, core.AckPacket):
-            self._remove(packet.msgNo)
-        elif isinstance(packet, core.RejectPacket):
-            self._remove(packet.msgNo)
-        elif hasattr(packet, "ackMsgNo"):
+        if isinstance(packet, (core.AckPacket, core.RejectPacket)):
+            ack_no = packet.msgNo
+        else:
             # Got a piggyback ack, so remove the original message
-            self._remove(packet.ackMsgNo)
+            ack_no = getattr(packet, "ackMsgNo", None)
+        if ack_no is None:
+            return
+        # The membership test is atomic under the GIL, so most packets
+        # (no ack correlation, or an ack we never tracked) return here
+        # without ever touching the lock.
+        if ack_no in self.data:
+            self._remove(ack_no)
 
     def tx(self, packet: type[core.Packet]) -> None:
         """Add a packet that was sent."""
@@ -97,10 +113,9 @@ class PacketTrack(objectstore.ObjectStoreMixin):
 
     def _remove(self, key):
         with self.lock:
-            try:
-                del self.data[key]
-            except KeyError:
-                pass
+            # pop with a default is one C call and skips raising and
+            # catching KeyError for untracked keys.
+            self.data.pop(key, None)
 
 
 # Now register the PacketList with the collector
@@ -1,3 +1,4 @@
+import json
 import logging
 import time
 
@@ -14,11 +15,24 @@ LOG = logging.getLogger("APRSD")
 
 class APRSRegistryThread(aprsd_threads.APRSDThread):
     """This sends service information to the configured APRS Registry."""
-    _loop_cnt: int = 1
 
     def __init__(self):
         super().__init__("APRSRegistryThread")
-        self._loop_cnt = 1
+        self._seconds_until_post = CONF.aprs_registry.frequency_seconds
+        # Reuse one session so the registry POSTs keep the connection
+        # alive instead of doing a TCP+TLS handshake every time.
+        self.session = requests.Session()
+        # The registry info never changes while we're running, so
+        # serialize it once instead of re-encoding the dict every post.
+        info = {
+            "callsign": CONF.callsign,
+            "description": CONF.aprs_registry.description,
+            "service_website": CONF.aprs_registry.service_website,
+            "software": f"APRSD version {aprsd.__version__} "
+                        "https://github.com/craigerl/aprsd",
+        }
+        self._payload = json.dumps(info).encode("utf-8")
+        self._headers = {"Content-Type": "application/json"}
         if not CONF.aprs_registry.enabled:
             LOG.error(
                 "APRS Registry is not enabled.  ",
@@ -34,23 +48,20 @@ class APRSRegistryThread(aprsd_threads.APRSDThread):
         )
 
     def loop(self):
-        # Only call the registry every N seconds
-        if self._loop_cnt % CONF.aprs_registry.frequency_seconds == 0:
-            info = {
-                "callsign": CONF.callsign,
-                "description": CONF.aprs_registry.description,
-                "service_website": CONF.aprs_registry.service_website,
-                "software": f"APRSD version {aprsd.__version__} "
-                            "https://github.com/craigerl/aprsd",
-            }
+        # Only call the registry every N seconds.  Counting down is
+        # cheaper than a modulo against the config on every pass.
+        self._seconds_until_post -= 1
+        if self._seconds_until_post <= 0:
+            self._seconds_until_post = CONF.aprs_registry.frequency_seconds
             try:
-                requests.post(
+                self.session.post(
                     f"{CONF.aprs_registry.registry_url}",
-                    json=info,
+                    data=self._payload,
+                    headers=self._headers,
+                    timeout=5,
                 )
             except Exception as e:
                 LOG.error(f"Failed to send registry info: {e}")
 
         time.sleep(1)
-        self._loop_cnt += 1
         return True
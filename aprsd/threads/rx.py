@@ -84,6 +84,14 @@ class APRSDDupeRXThread(APRSDRXThread):
     to be processed.
     """
 
+    def __init__(self, packet_queue):
+        super().__init__(packet_queue)
+        # Cache the singleton references once; going through the
+        # singleton __new__/__init__ dance for every received packet
+        # adds up.
+        self.pkt_list = packets.PacketList()
+        self.packet_collector = collector.PacketCollector()
+
     def process_packet(self, *args, **kwargs):
         """This handles the processing of an inbound packet.
 
@@ -98,7 +106,7 @@ class APRSDDupeRXThread(APRSDRXThread):
         packet = self._client.decode_packet(*args, **kwargs)
         # LOG.debug(raw)
         packet_log.log(packet)
-        pkt_list = packets.PacketList()
+        pkt_list = self.pkt_list
 
         if isinstance(packet, packets.AckPacket):
             # We don't need to drop AckPackets, those should be
@@ -118,7 +126,7 @@ class APRSDDupeRXThread(APRSDRXThread):
 
             if not found:
                 # We haven't seen this packet before, so we process it.
-                collector.PacketCollector().rx(packet)
+                self.packet_collector.rx(packet)
                 self.packet_queue.put(packet)
             elif packet.timestamp - found.timestamp < CONF.packet_dupe_timeout:
                 # If the packet came in within N seconds of the
@@ -129,7 +137,7 @@ class APRSDDupeRXThread(APRSDRXThread):
                     f"Packet {packet.from_call}:{packet.msgNo} already tracked "
                     f"but older than {CONF.packet_dupe_timeout} seconds. processing.",
                 )
-                collector.PacketCollector().rx(packet)
+                self.packet_collector.rx(packet)
                 self.packet_queue.put(packet)
 
 
@@ -150,25 +158,26 @@ class APRSDProcessPacketThread(APRSDThread):
 
     def __init__(self, packet_queue):
         self.packet_queue = packet_queue
+        self.packet_collector = collector.PacketCollector()
         super().__init__("ProcessPKT")
 
     def process_ack_packet(self, packet):
         """We got an ack for a message, no need to resend it."""
         ack_num = packet.msgNo
         LOG.debug(f"Got ack for message {ack_num}")
-        collector.PacketCollector().rx(packet)
+        self.packet_collector.rx(packet)
 
     def process_piggyback_ack(self, packet):
         """We got an ack embedded in a packet."""
         ack_num = packet.ackMsgNo
         LOG.debug(f"Got PiggyBackAck for message {ack_num}")
-        collector.PacketCollector().rx(packet)
+        self.packet_collector.rx(packet)
 
     def process_reject_packet(self, packet):
         """We got a reject message for a packet.  Stop sending the message."""
         ack_num = packet.msgNo
         LOG.debug(f"Got REJECT for message {ack_num}")
-        collector.PacketCollector().rx(packet)
+        self.packet_collector.rx(packet)
 
     def loop(self):
         try:
@@ -7,7 +7,6 @@ from rush import quota, throttle
 from rush.contrib import decorator
 from rush.limiters import periodic
 from rush.stores import dictionary
-import wrapt
 
 from aprsd import conf  # noqa
 from aprsd import threads as aprsd_threads
@@ -42,20 +41,20 @@ ack_throttle_decorator = decorator.ThrottleDecorator(throttle=ack_t)
 s_lock = threading.Lock()
 
 
-@wrapt.synchronized(s_lock)
 @msg_throttle_decorator.sleep_and_retry
 def send(packet: core.Packet, direct=False, aprs_client=None):
     """Send a packet either in a thread or directly to the client."""
-    # prepare the packet for sending.
-    # This constructs the packet.raw
-    packet.prepare()
-    # Have to call the collector to track the packet
-    # After prepare, as prepare assigns the msgNo
-    collector.PacketCollector().tx(packet)
-    if isinstance(packet, core.AckPacket):
-        _send_ack(packet, direct=direct, aprs_client=aprs_client)
-    else:
-        _send_packet(packet, direct=direct, aprs_client=aprs_client)
+    with s_lock:
+        # prepare the packet for sending.
+        # This constructs the packet.raw
+        packet.prepare()
+        # Have to call the collector to track the packet
+        # After prepare, as prepare assigns the msgNo
+        collector.PacketCollector().tx(packet)
+        if isinstance(packet, core.AckPacket):
+            _send_ack(packet, direct=direct, aprs_client=aprs_client)
+        else:
+            _send_packet(packet, direct=direct, aprs_client=aprs_client)
 
 
 @msg_throttle_decorator.sleep_and_retry
@@ -2,8 +2,6 @@ from multiprocessing import RawValue
 import random
 import threading
 
-import wrapt
-
 
 MAX_PACKET_ID = 9999
 
@@ -30,22 +28,22 @@ class PacketCounter:
             cls._instance.val = RawValue("i", random.randint(1, MAX_PACKET_ID))
         return cls._instance
 
-    @wrapt.synchronized(lock)
     def increment(self):
-        if self.val.value == MAX_PACKET_ID:
-            self.val.value = 1
-        else:
-            self.val.value += 1
+        with self.lock:
+            if self.val.value == MAX_PACKET_ID:
+                self.val.value = 1
+            else:
+                self.val.value += 1
 
     @property
-    @wrapt.synchronized(lock)
     def value(self):
-        return str(self.val.value)
+        with self.lock:
+            return str(self.val.value)
 
-    @wrapt.synchronized(lock)
     def __repr__(self):
-        return str(self.val.value)
+        with self.lock:
+            return str(self.val.value)
 
-    @wrapt.synchronized(lock)
     def __str__(self):
-        return str(self.val.value)
+        with self.lock:
+            return str(self.val.value)
@@ -27,7 +27,11 @@ class ObjectStoreMixin:
     """
 
     def __init__(self):
-        self.lock = threading.RLock()
+        # The users of this mixin are singletons, so __init__ runs on
+        # every instantiation.  Don't replace an existing lock; another
+        # thread could be holding the old one.
+        if not hasattr(self, "lock"):
+            self.lock = threading.RLock()
 
     def __len__(self):
         with self.lock:
@@ -74,7 +78,9 @@ class ObjectStoreMixin:
             return
         self._init_store()
         save_filename = self._save_filename()
-        if len(self) > 0:
+        # Gate on the data dict itself; a class like PacketList keeps
+        # more in self.data (the types table) than its __len__ counts.
+        if len(self.data) > 0:
             LOG.info(
                 f"{self.__class__.__name__}::Saving"
                 f" {len(self)} entries to disk at "
@@ -1,15 +1,22 @@
+import subprocess
+import sys
 import unittest
 from unittest import mock
 
 import aprslib
 from aprslib import util as aprslib_util
+from oslo_config import cfg
 
+from aprsd import conf  # noqa: F401
 from aprsd import packets
 from aprsd.packets import core
 
 from . import fake
 
 
+CONF = cfg.CONF
+
+
 class TestPacketBase(unittest.TestCase):
 
     def _fake_dict(
@@ -283,3 +290,85 @@ class TestPacketBase(unittest.TestCase):
         )
         expected = f"{fake.FAKE_FROM_CALLSIGN}>APZ100::{fake.FAKE_TO_CALLSIGN:<9}:{exp_msg}{{{msgno}"
         self.assertEqual(expected, str(packet))
+
+
+class TestPacketList(unittest.TestCase):
+    """Test the PacketList ring buffer."""
+
+    def setUp(self):
+        self._maxlen = CONF.packet_list_maxlen
+        self._stats_maxlen = CONF.packet_list_stats_maxlen
+        self._enable_save = CONF.enable_save
+        CONF.packet_list_maxlen = 5
+        CONF.packet_list_stats_maxlen = 3
+        CONF.enable_save = False
+        packets.PacketList._instance = None
+        self.packet_list = packets.PacketList()
+
+    def tearDown(self):
+        CONF.packet_list_maxlen = self._maxlen
+        CONF.packet_list_stats_maxlen = self._stats_maxlen
+        CONF.enable_save = self._enable_save
+        packets.PacketList._instance = None
+
+    def _packet(self, msg_number):
+        return packets.MessagePacket(
+            from_call=f"{fake.FAKE_FROM_CALLSIGN}{msg_number}",
+            to_call=fake.FAKE_TO_CALLSIGN,
+            msgNo=str(msg_number),
+        )
+
+    def test_rx_evicts_oldest_at_maxlen(self):
+        pkts = [self._packet(i) for i in range(7)]
+        for pkt in pkts:
+            self.packet_list.rx(pkt)
+
+        self.assertEqual(5, len(self.packet_list))
+        self.assertEqual(7, self.packet_list.total_rx())
+        # The two oldest packets fell off the ring.
+        self.assertRaises(KeyError, self.packet_list.find, pkts[0])
+        self.assertRaises(KeyError, self.packet_list.find, pkts[1])
+        self.assertEqual(pkts[2], self.packet_list.find(pkts[2]))
+        self.assertEqual(pkts[6], self.packet_list.find(pkts[6]))
+
+    def test_find_after_duplicate_key_re_added(self):
+        dupe = self._packet(1)
+        self.packet_list.rx(dupe)
+        self.packet_list.rx(self._packet(2))
+        # Re-add the same packet; it now occupies two ring slots.
+        self.packet_list.rx(dupe)
+        for i in range(3, 6):
+            self.packet_list.rx(self._packet(i))
+
+        # The oldest copy of dupe has been evicted by now, but the
+        # newer one must still be findable.
+        self.assertEqual(dupe, self.packet_list.find(dupe))
+
+    def test_stats_newest_first_capped(self):
+        pkts = [self._packet(i) for i in range(5)]
+        for pkt in pkts:
+            self.packet_list.rx(pkt)
+
+        stats = self.packet_list.stats()
+        # Newest first, capped at packet_list_stats_maxlen.
+        self.assertEqual([pkts[4], pkts[3], pkts[2]], stats["packets"])
+        self.assertEqual(5, stats["packet_count"])
+        self.assertEqual(5, stats["rx"])
+        self.assertEqual(0, stats["tx"])
+        self.assertEqual({"rx": 5, "tx": 0}, stats["types"]["MessagePacket"])
+
+
+class TestPacketsImport(unittest.TestCase):
+
+    def test_bare_import(self):
+        """aprsd.packets must import without the conf opts loaded.
+
+        The monitors register themselves with the PacketCollector at
+        import time, so nothing on that path may instantiate them or
+        otherwise touch unregistered config options.
+        """
+        result = subprocess.run(
+            [sys.executable, "-c", "import aprsd.packets"],
+            capture_output=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr.decode())